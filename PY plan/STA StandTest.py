@@ -9,6 +9,13 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.animation import FuncAnimation
 import logging
 from datetime import datetime
+import os
+import sys
+# stream_filters and sample_stream live at the repo root, shared with serial_weight_monitor.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from spectral import RollingSpectrogram
+from stream_filters import FilterChain, HampelFilter, BiquadLowPass, KalmanFilter
+from sample_stream import SampleServer, STREAM_PORT
 
 class ThrustMeasurementApp:
     """STA StandTest Loadcell 20 kg (thrust)"""
@@ -18,14 +25,26 @@ class ThrustMeasurementApp:
         'baud_rate': 9600,
         'serial_timeout': 1,
         'plot_interval_ms': 100,
-        'thrust_min_kgf': 0.0,
+        'thrust_min_kgf': -0.5,  # zero-load noise goes slightly negative
         'thrust_max_kgf': 12.0, 
-        'gravity': 9.81  
+        'gravity': 9.81,
+        'sample_rate_hz': 10.0,  # HX711 output rate; drives both the filter and the spectrogram
+        'spectrogram_nperseg': 32,
+        'spectrogram_columns': 120,
+        'filter_hampel_window': 7,
+        'filter_hampel_sigmas': 3.0,
+        'filter_hampel_min_kgf': 0.1,
+        'filter_cutoff_hz': 2.0,  # must stay below sample_rate_hz / 2
+        'filter_kalman': False,
+        'filter_kalman_process_var': 1e-3,
+        'filter_kalman_measurement_var': 1e-2
     }
 
-    def __init__(self, root):
+    def __init__(self, root, publisher=None):
         """Initialize the application with GUI and plot setup."""
         self.root = root
+        # Optional SampleServer; every filtered batch is forwarded to its subscribers
+        self.publisher = publisher
         self.root.title("Rocket Thrust Measurement System")
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
@@ -38,16 +57,31 @@ class ThrustMeasurementApp:
         self.is_measuring = False
         self.start_time = None
         self.read_thread = None
+        self.spectrogram = RollingSpectrogram(fs=self.CONFIG['sample_rate_hz'],
+                                              nperseg=self.CONFIG['spectrogram_nperseg'],
+                                              n_columns=self.CONFIG['spectrogram_columns'])
+        self.spectrogram_index = 0
+        self.sample_filter = self.build_filter()
+        self.pending_samples = []
+        self.out_of_range = False
 
         self.setup_gui()
         
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
+        self.fig, (self.ax, self.spec_ax) = plt.subplots(2, 1, figsize=(8, 6),
+                                                         gridspec_kw={'height_ratios': [2, 1]})
         self.line, = self.ax.plot([], [], lw=2, color='blue')
         self.ax.set_xlabel('Time (s)')
         self.ax.set_ylabel('Thrust (kgf)')
         self.ax.set_title('RThrust Measurement')
         self.ax.grid(True)
         self.ax.set_ylim(0, 12) 
+        self.spec_image = self.spec_ax.imshow(self.spectrogram.power_db(), aspect='auto', origin='lower',
+                                              extent=self.spectrogram.extent(), cmap='viridis',
+                                              vmin=-60, vmax=0, animated=True)
+        self.spec_ax.set_xlabel('Time before now (s)')
+        self.spec_ax.set_ylabel('Frequency (Hz)')
+        self.spec_ax.set_title('Live Spectrogram')
+        self.fig.tight_layout()
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
         self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
         
@@ -71,6 +105,18 @@ class ThrustMeasurementApp:
         self.status_label = ttk.Label(self.control_frame, text="Status: Idle")
         self.status_label.pack(side=tk.LEFT, padx=10)
 
+    def build_filter(self):
+        """Build the online filter chain applied to every batch of serial samples."""
+        stages = [
+            HampelFilter(window=self.CONFIG['filter_hampel_window'], n_sigmas=self.CONFIG['filter_hampel_sigmas'],
+                         min_threshold=self.CONFIG['filter_hampel_min_kgf']),
+            BiquadLowPass(self.CONFIG['filter_cutoff_hz'], self.CONFIG['sample_rate_hz']),
+        ]
+        if self.CONFIG['filter_kalman']:
+            stages.append(KalmanFilter(process_var=self.CONFIG['filter_kalman_process_var'],
+                                       measurement_var=self.CONFIG['filter_kalman_measurement_var']))
+        return FilterChain(stages)
+
     def start_measurement(self):
         """Initiate thrust measurement process."""
         if self.ser is None:
@@ -85,6 +131,11 @@ class ThrustMeasurementApp:
                 return
 
         self.data = []
+        self.spectrogram.reset()
+        self.spectrogram_index = 0
+        self.sample_filter.reset()
+        self.pending_samples = []
+        self.out_of_range = False
         self.start_time = time.time()
         self.is_measuring = True
         self.start_button.config(state=tk.DISABLED)
@@ -109,10 +160,17 @@ class ThrustMeasurementApp:
         self.stop_button.config(state=tk.DISABLED)
         self.status_label.config(text="Status: Idle")
 
+        if self.read_thread and self.read_thread.is_alive():
+            self.read_thread.join(timeout=self.CONFIG['serial_timeout'] + 1)
+        # The spike filter looks a few samples ahead; release the samples it is still holding
+        self.store_filtered(self.sample_filter.flush())
+
         if self.data:
             try:
-                df = pd.DataFrame(self.data, columns=['Time (s)', 'Thrust (kgf)'])
+                df = pd.DataFrame(self.data, columns=['Time (s)', 'Thrust (kgf)', 'Raw Thrust (kgf)'])
                 df['Thrust (N)'] = df['Thrust (kgf)'] * self.CONFIG['gravity']
+                # Raw channel goes last so existing column positions are unchanged
+                df = df[['Time (s)', 'Thrust (kgf)', 'Thrust (N)', 'Raw Thrust (kgf)']]
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f'thrust_data_{timestamp}.xlsx'
                 df.to_excel(filename, index=False)
@@ -126,34 +184,72 @@ class ThrustMeasurementApp:
     
 
     def read_from_serial(self):
-        """Read thrust data from Arduino in a separate thread."""
+        """Read thrust data from Arduino in a separate thread.
+
+        Lines already waiting in the serial buffer are read as one batch and run through the
+        filter chain together; each sample is stored as [time, filtered kgf, raw kgf]. Every parsed
+        value is kept in the raw channel, the thrust range is only checked on the filtered one.
+        """
         while self.is_measuring:
             try:
-                line = self.ser.readline().decode('utf-8').strip()
-                if line:
-                    try:
-                        thrust_kgf = float(line)
-                        if self.CONFIG['thrust_min_kgf'] <= thrust_kgf <= self.CONFIG['thrust_max_kgf']:
-                            current_time = time.time() - self.start_time
-                            self.data.append([current_time, thrust_kgf])
-                        else:
-                            self.logger.warning(f"Thrust value out of range: {thrust_kgf}")
-                    except ValueError:
-                        self.logger.warning(f"Invalid data received: {line}")
+                batch_times = []
+                batch_thrusts = []
+                while True:
+                    line = self.ser.readline().decode('utf-8').strip()
+                    if line:
+                        try:
+                            thrust_kgf = float(line)
+                            batch_times.append(time.time() - self.start_time)
+                            batch_thrusts.append(thrust_kgf)
+                        except ValueError:
+                            self.logger.warning(f"Invalid data received: {line}")
+                    if not self.ser.in_waiting:
+                        break
+                if batch_thrusts:
+                    self.pending_samples.extend(zip(batch_times, batch_thrusts))
+                    self.store_filtered(self.sample_filter.process(batch_thrusts))
             except serial.SerialException as e:
                 self.logger.error(f"Serial read error: {e}")
                 self.is_measuring = False
                 self.root.after(0, lambda: messagebox.showerror("Serial Error", f"Serial communication failed: {e}"))
                 break
 
+    def store_filtered(self, filtered):
+        """Pair filter output with the oldest samples still waiting for it."""
+        ready = self.pending_samples[:len(filtered)]
+        del self.pending_samples[:len(filtered)]
+        rows = [[t, thrust, raw] for (t, raw), thrust in zip(ready, filtered.tolist())]
+        for t, thrust, _ in rows:
+            # Log once per excursion rather than once per sample
+            in_range = self.CONFIG['thrust_min_kgf'] <= thrust <= self.CONFIG['thrust_max_kgf']
+            if not in_range and not self.out_of_range:
+                self.logger.warning(f"Filtered thrust out of range at {t:.2f}s: {thrust:.3f} kgf")
+            self.out_of_range = not in_range
+        self.data.extend(rows)
+        if rows and self.publisher is not None:
+            self.publisher.publish([row[0] for row in rows], [row[1] for row in rows])
+
     def update_plot(self, frame):
         """Update the real-time plot with latest data."""
         if self.is_measuring and self.data:
-            times = [d[0] for d in self.data]
-            thrusts = [d[1] for d in self.data]
+            data = self.data[:]
+            times = [d[0] for d in data]
+            thrusts = [d[1] for d in data]
+            raw_thrusts = [d[2] for d in data]
             self.line.set_data(times, thrusts)
             self.ax.set_xlim(0, max(times) + 0.1 if times else 1) 
-        return self.line,
+            self.update_spectrogram(times, raw_thrusts)
+        return self.line, self.spec_image
+
+    def update_spectrogram(self, times, thrusts):
+        """Feed only the samples received since the last frame into the rolling spectrogram."""
+        new_times = times[self.spectrogram_index:]
+        new_thrusts = thrusts[self.spectrogram_index:]
+        self.spectrogram_index = len(times)
+        if self.spectrogram.push(new_times, new_thrusts):
+            power_db = self.spectrogram.power_db()
+            self.spec_image.set_data(power_db)
+            self.spec_image.set_clim(power_db.max() - 60, power_db.max())
 
     def close_serial(self):
         """Safely close the serial connection."""
@@ -170,11 +266,18 @@ class ThrustMeasurementApp:
         """Handle application shutdown."""
         self.is_measuring = False
         self.close_serial()
+        if self.publisher is not None:
+            self.publisher.stop()
         self.root.destroy()
         
     
 
 if __name__ == "__main__":
+    # python "STA StandTest.py" --publish [host] streams filtered thrust to serial_weight_monitor.py --subscribe
+    publisher = None
+    if len(sys.argv) > 1 and sys.argv[1] == "--publish":
+        publisher = SampleServer(sys.argv[2] if len(sys.argv) > 2 else '127.0.0.1', STREAM_PORT)
+        publisher.start()
     root = tk.Tk()
-    app = ThrustMeasurementApp(root)
+    app = ThrustMeasurementApp(root, publisher)
     root.mainloop()
@@ -11,6 +11,8 @@ if not file_path:
 
 df = pd.read_excel(file_path)
 
+# Select by name: newer exports carry an extra 'Raw Thrust (kgf)' column
+df = df[['Time (s)', 'Thrust (kgf)', 'Thrust (N)']]
 df.columns = ['time', 'kgf', 'thrust']
 
 df['time'] = df['time'].astype(float)
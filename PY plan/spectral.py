@@ -0,0 +1,200 @@
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from tkinter import Tk
+from tkinter.filedialog import askopenfilename
+
+RESAMPLE_STEP = 0.01
+
+
+def resample_uniform(times, values, step=RESAMPLE_STEP):
+    """Resample a recording onto a uniform time grid, same as the normalization script."""
+    df = pd.DataFrame({'time': np.asarray(times, dtype=float), 'value': np.asarray(values, dtype=float)})
+    df = df.drop_duplicates(subset='time')
+    df.set_index('time', inplace=True)
+    df = df.sort_index()
+
+    new_time = np.arange(df.index.min(), df.index.max(), step)
+
+    df_interp = df.reindex(df.index.union(new_time))
+    df_interp = df_interp.interpolate(method='index')
+    df_interp = df_interp.loc[new_time]
+    return df_interp.index.to_numpy(), df_interp['value'].to_numpy()
+
+
+def frame_signal(values, nperseg, hop):
+    """Split a 1-D signal into overlapping frames as a strided (n_frames, nperseg) view."""
+    values = np.asarray(values, dtype=float)
+    if len(values) < nperseg:
+        return np.empty((0, nperseg))
+    frames = np.lib.stride_tricks.sliding_window_view(values, nperseg)
+    return frames[::hop]
+
+
+def _spectra(frames, window, fs):
+    """One-sided power spectral density of every frame at once (density scaling, mean removed)."""
+    frames = frames - frames.mean(axis=1, keepdims=True)
+    spectrum = np.fft.rfft(frames * window, axis=1)
+    power = (np.abs(spectrum) ** 2) / (fs * np.sum(window ** 2))
+    if window.size % 2:
+        power[:, 1:] *= 2
+    else:
+        power[:, 1:-1] *= 2
+    return power
+
+
+def welch_psd(values, fs, nperseg=256, overlap=0.5):
+    """Welch power spectral density: Hann-windowed overlapping segments, averaged."""
+    # A Hann window shorter than 3 points is all zeros, so there is nothing to estimate
+    if len(values) < 3:
+        return np.empty(0), np.empty(0)
+    nperseg = min(nperseg, len(values))
+    hop = max(1, int(nperseg * (1 - overlap)))
+    window = np.hanning(nperseg)
+    frames = frame_signal(values, nperseg, hop)
+    freqs = np.fft.rfftfreq(nperseg, d=1.0 / fs)
+    if not len(frames):
+        return freqs, np.zeros_like(freqs)
+    return freqs, _spectra(frames, window, fs).mean(axis=0)
+
+
+def stft(values, fs, nperseg=128, overlap=0.75):
+    """Short-time power spectrum; returns (freqs, segment centre times, power[freq, time])."""
+    hop = max(1, int(nperseg * (1 - overlap)))
+    window = np.hanning(nperseg)
+    frames = frame_signal(values, nperseg, hop)
+    freqs = np.fft.rfftfreq(nperseg, d=1.0 / fs)
+    seg_times = (np.arange(len(frames)) * hop + nperseg / 2) / fs
+    return freqs, seg_times, _spectra(frames, window, fs).T
+
+
+def median_step(times):
+    """Median interval between distinct timestamps, RESAMPLE_STEP if there are fewer than two."""
+    steps = np.diff(np.unique(np.asarray(times, dtype=float)))
+    return float(np.median(steps)) if len(steps) else RESAMPLE_STEP
+
+
+def analyze_recording(times, values, step=None, welch_nperseg=256, stft_nperseg=128):
+    """Welch PSD and STFT of a whole recording after resampling to a uniform rate.
+
+    step defaults to the recording's median sample interval; resampling a 10 SPS capture onto a
+    finer grid would only add interpolation artefacts above its Nyquist frequency.
+    """
+    if step is None:
+        step = median_step(times)
+    if len(times) < 2:
+        uniform_times, uniform_values = np.empty(0), np.empty(0)
+    else:
+        uniform_times, uniform_values = resample_uniform(times, values, step)
+    fs = 1.0 / step
+    freqs, psd = welch_psd(uniform_values, fs, nperseg=welch_nperseg)
+    stft_freqs, seg_times, power = stft(uniform_values, fs, nperseg=stft_nperseg)
+    return {
+        'fs': fs,
+        'freqs': freqs,
+        'psd': psd,
+        'peak_freq': freqs[np.argmax(psd[1:]) + 1] if len(psd) > 1 else 0.0,
+        'stft_freqs': stft_freqs,
+        'stft_times': seg_times + uniform_times[0] if len(uniform_times) else seg_times,
+        'stft_power': power,
+    }
+
+
+class RollingSpectrogram:
+    """Live spectrogram fed in batches; only new overlapping FFT blocks are computed per update."""
+
+    def __init__(self, fs=1.0 / RESAMPLE_STEP, nperseg=64, overlap=0.75, n_columns=120):
+        self.fs = fs
+        self.nperseg = nperseg
+        self.hop = max(1, int(nperseg * (1 - overlap)))
+        self.window = np.hanning(nperseg)
+        self.freqs = np.fft.rfftfreq(nperseg, d=1.0 / fs)
+        self.n_columns = n_columns
+        self.reset()
+
+    def reset(self):
+        """Forget all buffered samples and spectrogram columns."""
+        self.power = np.zeros((len(self.freqs), self.n_columns))
+        self._pending = np.empty(0)
+        self._next_time = None
+        self._last_time = None
+        self._last_value = None
+
+    def _resample(self, times, values):
+        """Interpolate a raw batch onto the uniform grid, continuing from the previous batch."""
+        times = np.asarray(times, dtype=float)
+        values = np.asarray(values, dtype=float)
+        if self._last_time is not None:
+            times = np.concatenate(([self._last_time], times))
+            values = np.concatenate(([self._last_value], values))
+        if self._next_time is None:
+            self._next_time = times[0]
+        grid = np.arange(self._next_time, times[-1], 1.0 / self.fs)
+        self._last_time, self._last_value = times[-1], values[-1]
+        if not len(grid):
+            return np.empty(0)
+        self._next_time = grid[-1] + 1.0 / self.fs
+        return np.interp(grid, times, values)
+
+    def push(self, times, values):
+        """Add a batch of raw samples; returns the number of new spectrogram columns."""
+        if not len(times):
+            return 0
+        self._pending = np.concatenate((self._pending, self._resample(times, values)))
+        frames = frame_signal(self._pending, self.nperseg, self.hop)
+        n_new = len(frames)
+        if not n_new:
+            return 0
+
+        columns = _spectra(frames, self.window, self.fs).T
+        if n_new >= self.n_columns:
+            self.power = columns[:, -self.n_columns:]
+        else:
+            self.power = np.roll(self.power, -n_new, axis=1)
+            self.power[:, -n_new:] = columns
+
+        # Keep the overlap tail so the next block starts exactly one hop after the last one
+        self._pending = self._pending[n_new * self.hop:]
+        return n_new
+
+    def power_db(self):
+        """Spectrogram in dB, shaped (freqs, columns) with the newest column on the right."""
+        return 10 * np.log10(self.power + 1e-12)
+
+    def extent(self):
+        """imshow extent in seconds before now and Hz."""
+        return (-self.n_columns * self.hop / self.fs, 0, self.freqs[0], self.freqs[-1])
+
+
+if __name__ == "__main__":
+    # python spectral.py: pick an STA StandTest .xlsx export and plot its PSD and spectrogram
+    Tk().withdraw()
+    file_path = askopenfilename(filetypes=[("Excel files", "*.xlsx")])
+    if not file_path:
+        raise SystemExit("No file selected")
+
+    df = pd.read_excel(file_path)
+    times = df['Time (s)'].astype(float)
+    thrusts = df['Thrust (kgf)'].astype(float)
+    # Short burns hold only a few dozen samples, so shrink the STFT block to fit the recording
+    result = analyze_recording(times, thrusts, stft_nperseg=min(128, max(16, len(df) // 4)))
+    print(f"Sample rate: {result['fs']:.2f} Hz, dominant frequency: {result['peak_freq']:.3f} Hz")
+
+    fig, (psd_ax, spec_ax) = plt.subplots(2, 1, figsize=(10, 8))
+    psd_ax.semilogy(result['freqs'], result['psd'], color='blue')
+    psd_ax.set_xlabel("Frequency (Hz)")
+    psd_ax.set_ylabel("PSD (kgf²/Hz)")
+    psd_ax.set_title("Welch Power Spectral Density")
+    psd_ax.grid(True)
+
+    if result['stft_power'].size:
+        mesh = spec_ax.pcolormesh(result['stft_times'], result['stft_freqs'],
+                                  10 * np.log10(result['stft_power'] + 1e-12), shading='nearest')
+        fig.colorbar(mesh, ax=spec_ax, label="Power (dB)")
+        spec_ax.set_title("Spectrogram")
+    else:
+        spec_ax.set_title("Spectrogram (recording too short)")
+    spec_ax.set_xlabel("Time (s)")
+    spec_ax.set_ylabel("Frequency (Hz)")
+    plt.tight_layout()
+    plt.show()
@@ -6,28 +6,133 @@ import csv
 
 ser = serial.Serial('COM5', 57600, timeout=1)
 
-def read_data():
+HX711_SAMPLE_PERIOD = 0.1  # HX711 at 10 SPS (RATE pin low)
+
+def parse_weight(raw):
     try:
-        line = ser.readline().decode('utf-8').strip()
+        line = raw.decode('utf-8').strip()
         if line:
-            weight = float(line)  
-            return weight
-    except:
+            return float(line)
+    except (UnicodeDecodeError, ValueError):
+        pass
+    return None
+
+def read_data():
+    try:
+        return parse_weight(ser.readline())
+    except serial.SerialException:
         return None
 
-def collect_data(duration=10, sampling_rate=0.1):
+def drain_buffer(not_before, sample_period=HX711_SAMPLE_PERIOD):
+    """Read every complete line already waiting in the serial buffer.
+
+    A backlog is read all at once, so stamping lines as they are read would bunch them together.
+    The newest line gets the drain time and each older one is back-dated one HX711 sample period
+    before the next. If that would reach back past `not_before` (the previous sample's time) the
+    lines are spread evenly after it instead.
+    """
+    lines = []
+    while ser.in_waiting:
+        lines.append(ser.readline())
+    if not lines:
+        return []
+    received = time.perf_counter()
+    span = min((len(lines) - 1) * sample_period, (received - not_before) * (len(lines) - 1) / len(lines))
+    steps = np.arange(len(lines) - 1, -1, -1) / max(len(lines) - 1, 1)
+    stamps = received - span * steps
+    samples = []
+    for stamp, raw in zip(stamps, lines):
+        weight = parse_weight(raw)
+        if weight is not None:
+            samples.append((stamp, weight))
+    return samples
+
+def collect_data(duration=10, sampling_rate=0.1, mode="drain", output=None, keep_in_memory=True):
+    """Acquire weights for `duration` seconds.
+
+    mode="drain" keeps every sample the HX711 sends; backlogged lines are back-dated (see drain_buffer).
+    mode="fixed" ticks every `sampling_rate` seconds on perf_counter deadlines, takes the latest
+    buffered sample at each tick and reports jitter and overruns (ticks missed because a tick ran late).
+    If `output` is a filename, rows are streamed to CSV as they arrive instead of waiting for the end.
+    A serial error ends the acquisition early and returns what was collected so far.
+    """
+    if mode not in ("drain", "fixed"):
+        raise ValueError(f"Unknown acquisition mode: {mode}")
     weight_data = []
     timestamps = []
-    start_time = time.time()
+    file = writer = None
+    if output:
+        file = open(output, mode="w", newline="")
+        writer = csv.writer(file)
+        writer.writerow(["Time (s)", "Weight (g)"])
 
-    while time.time() - start_time < duration:
-        weight = read_data()
-        if weight is not None:
+    def record(t, weight):
+        if keep_in_memory:
+            timestamps.append(t)
             weight_data.append(weight)
-            timestamps.append(time.time() - start_time)
-            time.sleep(sampling_rate) 
+        if writer:
+            writer.writerow([f"{t:.4f}", f"{weight:.2f}"])
+
+    ser.reset_input_buffer()
+    start_time = time.perf_counter()
+    end_time = start_time + duration
+    try:
+        if mode == "drain":
+            last_stamp = start_time
+            while time.perf_counter() < end_time:
+                samples = drain_buffer(last_stamp)
+                if not samples:
+                    # Block for the next line instead of spinning; readline returns on timeout
+                    weight = read_data()
+                    if weight is not None:
+                        samples = [(time.perf_counter(), weight)]
+                for received, weight in samples:
+                    record(received - start_time, weight)
+                    last_stamp = received
+                if file and samples:
+                    # Push each batch to disk so a live viewer sees it and a crash loses at most one batch
+                    file.flush()
+        elif mode == "fixed":
+            jitter = []
+            overruns = 0
+            latest = None
+            deadline = start_time
+            while deadline < end_time:
+                now = time.perf_counter()
+                if now < deadline:
+                    time.sleep(deadline - now)
+                    now = time.perf_counter()
+                jitter.append(now - deadline)
+
+                samples = drain_buffer(now)
+                if samples:
+                    latest = samples[-1][1]
+                if latest is not None:
+                    record(deadline - start_time, latest)
+                    if file:
+                        file.flush()
+
+                deadline += sampling_rate
+                now = time.perf_counter()
+                if now > deadline:
+                    # Skip the ticks we already missed rather than firing them back-to-back
+                    missed = int((now - deadline) // sampling_rate) + 1
+                    overruns += missed
+                    deadline += missed * sampling_rate
+
+            if jitter:
+                jitter_ms = np.array(jitter) * 1000
+                print(f"Tick jitter: mean {jitter_ms.mean():.3f} ms, max {jitter_ms.max():.3f} ms, "
+                      f"p99 {np.percentile(jitter_ms, 99):.3f} ms")
+            print(f"Overruns: {overruns}")
+    except serial.SerialException as e:
+        print(f"Serial read error, stopping acquisition: {e}")
+    finally:
+        if file:
+            file.close()
+            print(f"Data streamed to {output}")
+        ser.close()
 
-    ser.close() 
     return timestamps, weight_data
 
 def analyze_weight(timestamps, weight_data):
@@ -61,10 +166,18 @@ def save_to_csv(timestamps, weight_data, filename="weight_data.csv"):
 
 
 duration = 5
-timestamps, weight_data = collect_data(duration)
+sampling_rate = 0.1
+mode = "drain"  # "drain" keeps every sample, "fixed" ticks every sampling_rate seconds
+output = None  # e.g. "weight_stream.csv" to stream rows to disk while recording
+# A streamed capture is already on disk and not held in memory; analyse the CSV afterwards instead
+timestamps, weight_data = collect_data(duration, sampling_rate, mode=mode, output=output,
+                                       keep_in_memory=output is None)
 
-max_weight, avg_weight, total_weight = analyze_weight(timestamps, weight_data)
+if weight_data:
+    max_weight, avg_weight, total_weight = analyze_weight(timestamps, weight_data)
 
-plot_weight(timestamps, weight_data)
-save_to_csv(timestamps,weight_data)
+    plot_weight(timestamps, weight_data)
+    save_to_csv(timestamps,weight_data)
+elif output is None:
+    print("No samples collected")
 #saveRawData
@@ -4,9 +4,12 @@ from scipy.integrate import simps
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import mplcursors
 import numpy as np
 import os
+import io
+import sys
+import threading
+from uncertainty import monte_carlo_uncertainty, CONFIDENCE
 
 def load_data():
     root = tk.Tk()
@@ -45,94 +48,321 @@ def analyze_weight_change(data):
 def apply_smoothing(weight_data, window_size=5):
     return np.convolve(weight_data, np.ones(window_size)/window_size, mode='same')
 
-def plot_graph(data, canvas, smooth=False):
-    fig, ax = plt.subplots(figsize=(6, 4))
-    weight_data = data["Weight (kg)"]
+def calculate_cumulative_impulse(times, weights):
+    """Running trapezoidal impulse, cumulative[i] is the impulse from times[0] to times[i]."""
+    cumulative = np.zeros(len(times))
+    if len(times) > 1:
+        cumulative[1:] = np.cumsum(0.5 * (weights[1:] + weights[:-1]) * np.diff(times))
+    return cumulative
+
+class GrowableArray:
+    """1-D float buffer that doubles its capacity when full, so appending is amortised O(1)."""
+
+    def __init__(self, capacity=1024):
+        self.data = np.empty(capacity)
+        self.size = 0
+
+    def reserve(self, capacity):
+        if capacity > len(self.data):
+            data = np.empty(max(capacity, 2 * len(self.data)))
+            data[:self.size] = self.data[:self.size]
+            self.data = data
+
+    def extend(self, values):
+        self.reserve(self.size + len(values))
+        self.data[self.size:self.size + len(values)] = values
+        self.size += len(values)
+
+    def view(self, extra=()):
+        """The stored values, followed by `extra` written after them without being kept."""
+        self.reserve(self.size + len(extra))
+        self.data[self.size:self.size + len(extra)] = extra
+        return self.data[:self.size + len(extra)]
+
+class SeriesBuffer:
+    """Time-ordered samples with their running impulse, kept in growable buffers for hover lookups."""
+
+    def __init__(self, times=(), weights=()):
+        self.times = GrowableArray()
+        self.weights = GrowableArray()
+        self.cumulative = GrowableArray()
+        if len(times):
+            times = np.asarray(times, dtype=float)
+            weights = np.asarray(weights, dtype=float)
+            order = np.argsort(times, kind="stable")
+            self.extend(times[order], weights[order])
+
+    def __len__(self):
+        return self.times.size
+
+    def extend(self, times, weights):
+        """Append samples that are all later than the ones already stored."""
+        times = np.asarray(times, dtype=float)
+        weights = np.asarray(weights, dtype=float)
+        if not len(times):
+            return
+        if len(self):
+            # Continue the running impulse from the last stored sample
+            cumulative = calculate_cumulative_impulse(np.concatenate((self.times.view()[-1:], times)),
+                                                      np.concatenate((self.weights.view()[-1:], weights)))
+            cumulative = cumulative[1:] + self.cumulative.view()[-1]
+        else:
+            cumulative = calculate_cumulative_impulse(times, weights)
+        self.times.extend(times)
+        self.weights.extend(weights)
+        self.cumulative.extend(cumulative)
+
+    def view(self):
+        return self.times.view(), self.weights.view(), self.cumulative.view()
+
+    def limits(self):
+        """(x_min, x_max, y_min, y_max) of the stored samples."""
+        if not len(self):
+            return 0.0, 1.0, 0.0, 1.0
+        times, weights, _ = self.view()
+        return times[0], times[-1], weights.min(), weights.max()
+
+def attach_hover_readout(ax, chart_type, series, window=25):
+    """Crosshair and hover readout that looks samples up by index instead of scanning every vertex.
+
+    The sample under the cursor is found by binary search on the time column of `series` (a
+    SeriesBuffer, which may keep growing), then the y-nearest point is picked from a small window of
+    neighbours around it. Only the crosshair and annotation are redrawn on mouse move, blitted over
+    a background cached on every full draw.
+    """
+    times, weights, _ = series.view()
+
+    vline = ax.axvline(times[0] if len(times) else 0, color="gray", lw=0.8, ls="--", animated=True, visible=False)
+    hline = ax.axhline(weights[0] if len(weights) else 0, color="gray", lw=0.8, ls="--", animated=True, visible=False)
+    point, = ax.plot([], [], "o", color="red", ms=5, animated=True, visible=False)
+    annotation = ax.annotate("", xy=(0, 0), xytext=(15, 15), textcoords="offset points",
+                             bbox=dict(boxstyle="round", fc="lightyellow", alpha=0.9),
+                             animated=True, visible=False)
+    artists = (vline, hline, point, annotation)
+    background = None
+
+    def on_draw(event):
+        nonlocal background
+        background = chart_type.copy_from_bbox(chart_type.figure.bbox)
+        for artist in artists:
+            if artist.get_visible():
+                ax.draw_artist(artist)
+
+    def blit():
+        if background is None:
+            return
+        chart_type.restore_region(background)
+        for artist in artists:
+            ax.draw_artist(artist)
+        chart_type.blit(chart_type.figure.bbox)
+
+    def on_move(event):
+        times, weights, cumulative = series.view()
+        if event.inaxes is not ax or event.xdata is None or not len(times):
+            if annotation.get_visible():
+                for artist in artists:
+                    artist.set_visible(False)
+                blit()
+            return
+
+        centre = np.searchsorted(times, event.xdata)
+        lo = max(centre - window, 0)
+        hi = min(centre + window + 1, len(times))
+        nearby = weights[lo:hi]
+        y_span = np.subtract(*ax.get_ylim()[::-1]) or 1.0
+        x_span = np.subtract(*ax.get_xlim()[::-1]) or 1.0
+        distance = np.hypot((times[lo:hi] - event.xdata) / x_span, (nearby - event.ydata) / y_span)
+        idx = lo + int(np.argmin(distance))
+
+        impulse = np.interp(event.xdata, times, cumulative)
+        vline.set_xdata([event.xdata, event.xdata])
+        hline.set_ydata([event.ydata, event.ydata])
+        point.set_data([times[idx]], [weights[idx]])
+        annotation.xy = (times[idx], weights[idx])
+        annotation.set_text(f"Time: {times[idx]:.2f}s\nWeight: {weights[idx]:.3f}kg\n"
+                            f"Impulse: {impulse:.3f}kg·s")
+        for artist in artists:
+            artist.set_visible(True)
+        blit()
+
+    return (chart_type.mpl_connect("draw_event", on_draw),
+            chart_type.mpl_connect("motion_notify_event", on_move))
+
+def show_uncertainty(analysis_frame, data=None, poll_ms=200):
+    """Monte Carlo confidence intervals for impulse, peak and burn time under the statistics.
+
+    The simulation runs on a worker thread so the window opens straight away; the labels are
+    filled in from the Tk thread once the result is ready. Returns update(times, weights), which
+    recomputes the intervals for new samples; a result that arrives after a newer update is dropped.
+    """
+    level = f"{CONFIDENCE * 100:.0f}%"
+    rows = (("Impulse", "impulse", "kg·s"), ("Peak", "peak", "kg"), ("Burn Time", "burn_time", "s"))
+    labels = {}
+    for label, key, unit in rows:
+        labels[key] = ttk.Label(analysis_frame, text=f"{label} {level} CI: N/A")
+        labels[key].pack(anchor="w", pady=2)
+    generation = 0
+
+    def update(times, weights):
+        nonlocal generation
+        generation += 1
+        current = generation
+        if len(times) < 2:
+            for label, key, unit in rows:
+                labels[key].config(text=f"{label} {level} CI: N/A")
+            return
+        # Copy so the worker never sees buffers that the caller keeps appending to
+        times = np.array(times, dtype=float)
+        weights = np.array(weights, dtype=float)
+        outcome = []
+        for label, key, unit in rows:
+            labels[key].config(text=f"{label} {level} CI: computing...")
+
+        def worker():
+            try:
+                outcome.append(monte_carlo_uncertainty(times, weights))
+            except Exception as e:
+                outcome.append(e)
+
+        def check():
+            if not analysis_frame.winfo_exists() or current != generation:
+                return
+            if not outcome:
+                analysis_frame.after(poll_ms, check)
+                return
+            result = outcome[0]
+            for label, key, unit in rows:
+                if isinstance(result, Exception):
+                    labels[key].config(text=f"{label} {level} CI: unavailable ({result})")
+                else:
+                    nominal, low, high = result[key]
+                    labels[key].config(text=f"{label} {level} CI: {low:.3f} – {high:.3f} {unit} (nominal {nominal:.3f})")
+
+        threading.Thread(target=worker, daemon=True).start()
+        analysis_frame.after(poll_ms, check)
+
+    if data is not None:
+        update(data["Time (s)"], data["Weight (kg)"])
+    return update
+
+def create_report_window(title, table_title="Weight Changes Table"):
+    """Report window shared by create_gui and follow_gui: graph on top, results left, table right.
+
+    Returns (root, graph_frame, analysis_frame, tree).
+    """
+    root = tk.Tk()
+    root.title(title)
+    root.geometry("1000x700")
+    root.resizable(False, False)
 
-    if smooth:
-        weight_data = apply_smoothing(weight_data)
+    graph_frame = ttk.LabelFrame(root, text="Graph", padding=(10, 5))
+    graph_frame.pack(side="top", fill="both", expand=True, padx=10, pady=5)
 
-    line, = ax.plot(data["Time (s)"], weight_data, label="Weight", color="blue")
-    ax.set_xlabel("Time (s)")
-    ax.set_ylabel("Weight (kg)")
-    ax.set_title("Teerathap, Weight Over Time")
-    ax.legend()
-    ax.grid(True)
+    analysis_frame = ttk.LabelFrame(root, text="Analysis Results", padding=(10, 5))
+    analysis_frame.pack(side="left", fill="y", expand=False, padx=10, pady=5)
 
-    cursor = mplcursors.cursor(line, hover=True)
-    cursor.connect("add", lambda sel: sel.annotation.set_text(
-        f"Time: {sel.target[0]:.2f}s\nWeight: {sel.target[1]:.3f}kg"))
+    table_frame = ttk.LabelFrame(root, text=table_title, padding=(10, 5))
+    table_frame.pack(side="right", fill="both", expand=True, padx=10, pady=5)
 
-    chart_type = FigureCanvasTkAgg(fig, master=canvas)
-    chart_type.get_tk_widget().pack(fill="both", expand=True)
-    chart_type.draw()
+    cols = ("Time (s)", "Weight (kg)", "Weight Change (kg)")
+    tree = ttk.Treeview(table_frame, columns=cols, show="headings", height=15)
+    for col in cols:
+        tree.heading(col, text=col)
+        tree.column(col, anchor="center")
+    tree.pack(side="left", fill="both", expand=True)
+    scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=tree.yview)
+    tree.configure(yscroll=scrollbar.set)
+    scrollbar.pack(side="right", fill="y")
+
+    return root, graph_frame, analysis_frame, tree
+
+def insert_table_rows(tree, times, weights, changes):
+    for t, w, change in zip(times, weights, changes):
+        tree.insert("", "end", values=(
+            f"{t:.2f}",
+            f"{w:.3f}",
+            f"{change:.3f}" if not pd.isna(change) else "N/A"
+        ))
+
+def add_navigation_buttons(canvas, ax, chart_type, data_limits, smooth_graph, reset_smooth):
+    """Zoom, pan and smoothing buttons under a chart.
+
+    data_limits() returns (x_min, x_max, y_min, y_max) of the plotted samples and is called on every
+    press, so a chart that is still growing zooms out to its current extent. chart_type.user_view is
+    True once the view was zoomed or panned and False again after Reset Zoom.
+    """
+    chart_type.user_view = False
 
-    x_min, x_max = data["Time (s)"].min(), data["Time (s)"].max()
-    y_min, y_max = weight_data.min(), weight_data.max()
+    def set_view(x_min, x_max, y_min, y_max, user_view=True):
+        ax.set_xlim([x_min, x_max])
+        ax.set_ylim([y_min, y_max])
+        chart_type.user_view = user_view
+        chart_type.draw()
 
     def zoom_in():
-        nonlocal x_min, x_max, y_min, y_max
+        x_min, x_max = ax.get_xlim()
+        y_min, y_max = ax.get_ylim()
         x_center = (x_min + x_max) / 2
         y_center = (y_min + y_max) / 2
         x_range = (x_max - x_min) * 0.5
         y_range = (y_max - y_min) * 0.5
-        x_min, x_max = x_center - x_range / 2, x_center + x_range / 2
-        y_min, y_max = y_center - y_range / 2, y_center + y_range / 2
-        ax.set_xlim([x_min, x_max])
-        ax.set_ylim([y_min, y_max])
-        chart_type.draw()
+        set_view(x_center - x_range / 2, x_center + x_range / 2, y_center - y_range / 2, y_center + y_range / 2)
 
     def zoom_out():
-        nonlocal x_min, x_max, y_min, y_max
+        x_min, x_max = ax.get_xlim()
+        y_min, y_max = ax.get_ylim()
+        data_x_min, data_x_max, data_y_min, data_y_max = data_limits()
         x_center = (x_min + x_max) / 2
         y_center = (y_min + y_max) / 2
         x_range = (x_max - x_min) * 2
         y_range = (y_max - y_min) * 2
-        x_min_new = max(data["Time (s)"].min(), x_center - x_range / 2)
-        x_max_new = min(data["Time (s)"].max(), x_center + x_range / 2)
-        y_min_new = max(weight_data.min(), y_center - y_range / 2)
-        y_max_new = min(weight_data.max(), y_center + y_range / 2)
-        x_min, x_max = x_min_new, x_max_new
-        y_min, y_max = y_min_new, y_max_new
-        ax.set_xlim([x_min, x_max])
-        ax.set_ylim([y_min, y_max])
-        chart_type.draw()
+        set_view(max(data_x_min, x_center - x_range / 2), min(data_x_max, x_center + x_range / 2),
+                 max(data_y_min, y_center - y_range / 2), min(data_y_max, y_center + y_range / 2))
 
     def reset_zoom():
-        nonlocal x_min, x_max, y_min, y_max
-        x_min, x_max = data["Time (s)"].min(), data["Time (s)"].max()
-        y_min, y_max = weight_data.min(), weight_data.max()
-        ax.set_xlim([x_min, x_max])
-        ax.set_ylim([y_min, y_max])
-        chart_type.draw()
+        set_view(*data_limits(), user_view=False)
 
-    def pan_left():
-        nonlocal x_min, x_max
-        shift = (x_max - x_min) * 0.1
-        x_min, x_max = x_min - shift, x_max - shift
-        ax.set_xlim([x_min, x_max])
-        chart_type.draw()
+    def pan(dx, dy):
+        x_min, x_max = ax.get_xlim()
+        y_min, y_max = ax.get_ylim()
+        x_shift = (x_max - x_min) * dx
+        y_shift = (y_max - y_min) * dy
+        set_view(x_min + x_shift, x_max + x_shift, y_min + y_shift, y_max + y_shift)
 
-    def pan_right():
-        nonlocal x_min, x_max
-        shift = (x_max - x_min) * 0.1
-        x_min, x_max = x_min + shift, x_max + shift
-        ax.set_xlim([x_min, x_max])
-        chart_type.draw()
+    button_frame = ttk.Frame(canvas)
+    button_frame.pack(side="bottom", fill="x", padx=10, pady=5)
+    ttk.Button(button_frame, text="Zoom In", command=zoom_in).pack(side="left", padx=5)
+    ttk.Button(button_frame, text="Zoom Out", command=zoom_out).pack(side="left", padx=5)
+    ttk.Button(button_frame, text="Reset Zoom", command=reset_zoom).pack(side="left", padx=5)
+    ttk.Button(button_frame, text="Smooth", command=smooth_graph).pack(side="left", padx=5)
+    ttk.Button(button_frame, text="Reset Smooth", command=reset_smooth).pack(side="left", padx=5)
+    ttk.Button(button_frame, text="←", command=lambda: pan(-0.1, 0)).pack(side="left", padx=5)
+    ttk.Button(button_frame, text="→", command=lambda: pan(0.1, 0)).pack(side="left", padx=5)
+    ttk.Button(button_frame, text="↑", command=lambda: pan(0, 0.1)).pack(side="left", padx=5)
+    ttk.Button(button_frame, text="↓", command=lambda: pan(0, -0.1)).pack(side="left", padx=5)
 
-    def pan_up():
-        nonlocal y_min, y_max
-        shift = (y_max - y_min) * 0.1
-        y_min, y_max = y_min + shift, y_max + shift
-        ax.set_ylim([y_min, y_max])
-        chart_type.draw()
+def build_chart(canvas, times, weights, series, smooth_graph, reset_smooth):
+    """Weight-over-time chart with hover readout and navigation; returns (ax, line, chart_type)."""
+    fig, ax = plt.subplots(figsize=(6, 4))
+    line, = ax.plot(times, weights, label="Weight", color="blue")
+    ax.set_xlabel("Time (s)")
+    ax.set_ylabel("Weight (kg)")
+    ax.set_title("Teerathap, Weight Over Time")
+    ax.legend()
+    ax.grid(True)
 
-    def pan_down():
-        nonlocal y_min, y_max
-        shift = (y_max - y_min) * 0.1
-        y_min, y_max = y_min - shift, y_max - shift
-        ax.set_ylim([y_min, y_max])
-        chart_type.draw()
+    chart_type = FigureCanvasTkAgg(fig, master=canvas)
+    chart_type.get_tk_widget().pack(fill="both", expand=True)
+    chart_type.hover_readout = attach_hover_readout(ax, chart_type, series)
+    add_navigation_buttons(canvas, ax, chart_type, series.limits, smooth_graph, reset_smooth)
+    chart_type.draw()
+    return ax, line, chart_type
+
+def plot_graph(data, canvas, smooth=False):
+    weight_data = data["Weight (kg)"]
+
+    if smooth:
+        weight_data = apply_smoothing(weight_data)
 
     def smooth_graph():
         for widget in canvas.winfo_children():
@@ -144,59 +374,23 @@ def plot_graph(data, canvas, smooth=False):
             widget.destroy()
         plot_graph(data, canvas, smooth=False)
 
-    button_frame = ttk.Frame(canvas)
-    button_frame.pack(side="bottom", fill="x", padx=10, pady=5)
-    ttk.Button(button_frame, text="Zoom In", command=zoom_in).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="Zoom Out", command=zoom_out).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="Reset Zoom", command=reset_zoom).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="Smooth", command=smooth_graph).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="Reset Smooth", command=reset_smooth).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="←", command=pan_left).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="→", command=pan_right).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="↑", command=pan_up).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="↓", command=pan_down).pack(side="left", padx=5)
+    build_chart(canvas, data["Time (s)"], weight_data, SeriesBuffer(data["Time (s)"], weight_data),
+                smooth_graph, reset_smooth)
 
 def create_gui(data):
-    root = tk.Tk()
-    root.title("Weight Analysis Report")
-    root.geometry("1000x700")
-    root.resizable(False, False)
-
-    graph_frame = ttk.LabelFrame(root, text="Graph", padding=(10, 5))
-    graph_frame.pack(side="top", fill="both", expand=True, padx=10, pady=5)
+    root, graph_frame, analysis_frame, tree = create_report_window("Weight Analysis Report")
     plot_graph(data, graph_frame)
 
     mean_weight, std_dev_weight = calculate_basic_statistics(data)
     total_impulse = calculate_total_impulse(data)
     data = analyze_weight_change(data)
 
-    analysis_frame = ttk.LabelFrame(root, text="Analysis Results", padding=(10, 5))
-    analysis_frame.pack(side="left", fill="y", expand=False, padx=10, pady=5)
-
     ttk.Label(analysis_frame, text=f"Average Weight: {mean_weight:.3f} kg").pack(anchor="w", pady=2)
     ttk.Label(analysis_frame, text=f"Standard Deviation: {std_dev_weight:.3f} kg").pack(anchor="w", pady=2)
     ttk.Label(analysis_frame, text=f"Total Impulse: {total_impulse:.3f} kg·s").pack(anchor="w", pady=2)
+    show_uncertainty(analysis_frame, data)
 
-    table_frame = ttk.LabelFrame(root, text="Weight Changes Table", padding=(10, 5))
-    table_frame.pack(side="right", fill="both", expand=True, padx=10, pady=5)
-
-    cols = ("Time (s)", "Weight (kg)", "Weight Change (kg)")
-    tree = ttk.Treeview(table_frame, columns=cols, show="headings", height=15)
-    for col in cols:
-        tree.heading(col, text=col)
-        tree.column(col, anchor="center")
-
-    for _, row in data.iterrows():
-        tree.insert("", "end", values=(
-            f"{row['Time (s)']:.2f}",
-            f"{row['Weight (kg)']:.3f}",
-            f"{row['Weight Change (kg)']:.3f}" if not pd.isna(row['Weight Change (kg)']) else "N/A"
-        ))
-
-    tree.pack(side="left", fill="both", expand=True)
-    scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=tree.yview)
-    tree.configure(yscroll=scrollbar.set)
-    scrollbar.pack(side="right", fill="y")
+    insert_table_rows(tree, data["Time (s)"], data["Weight (kg)"], data["Weight Change (kg)"])
 
     root.mainloop()
 
@@ -216,94 +410,11 @@ def apply_smoothing(weight_data, window_size=5):
     return np.convolve(weight_data, np.ones(window_size)/window_size, mode='same')
 
 def plot_graph(data, canvas, smooth=False):
-    fig, ax = plt.subplots(figsize=(6, 4))
     weight_data = data["Weight (kg)"]
 
     if smooth:
         weight_data = apply_smoothing(weight_data)
 
-    line, = ax.plot(data["Time (s)"], weight_data, label="Weight", color="blue")
-    ax.set_xlabel("Time (s)")
-    ax.set_ylabel("Weight (kg)")
-    ax.set_title("Teerathap, Weight Over Time")
-    ax.legend()
-    ax.grid(True)
-
-    cursor = mplcursors.cursor(line, hover=True)
-    cursor.connect("add", lambda sel: sel.annotation.set_text(
-        f"Time: {sel.target[0]:.2f}s\nWeight: {sel.target[1]:.3f}kg"))
-
-    chart_type = FigureCanvasTkAgg(fig, master=canvas)
-    chart_type.get_tk_widget().pack(fill="both", expand=True)
-    chart_type.draw()
-
-    x_min, x_max = data["Time (s)"].min(), data["Time (s)"].max()
-    y_min, y_max = weight_data.min(), weight_data.max()
-
-    def zoom_in():
-        nonlocal x_min, x_max, y_min, y_max
-        x_center = (x_min + x_max) / 2
-        y_center = (y_min + y_max) / 2
-        x_range = (x_max - x_min) * 0.5
-        y_range = (y_max - y_min) * 0.5
-        x_min, x_max = x_center - x_range / 2, x_center + x_range / 2
-        y_min, y_max = y_center - y_range / 2, y_center + y_range / 2
-        ax.set_xlim([x_min, x_max])
-        ax.set_ylim([y_min, y_max])
-        chart_type.draw()
-
-    def zoom_out():
-        nonlocal x_min, x_max, y_min, y_max
-        x_center = (x_min + x_max) / 2
-        y_center = (y_min + y_max) / 2
-        x_range = (x_max - x_min) * 2
-        y_range = (y_max - y_min) * 2
-        x_min_new = max(data["Time (s)"].min(), x_center - x_range / 2)
-        x_max_new = min(data["Time (s)"].max(), x_center + x_range / 2)
-        y_min_new = max(weight_data.min(), y_center - y_range / 2)
-        y_max_new = min(weight_data.max(), y_center + y_range / 2)
-        x_min, x_max = x_min_new, x_max_new
-        y_min, y_max = y_min_new, y_max_new
-        ax.set_xlim([x_min, x_max])
-        ax.set_ylim([y_min, y_max])
-        chart_type.draw()
-
-    def reset_zoom():
-        nonlocal x_min, x_max, y_min, y_max
-        x_min, x_max = data["Time (s)"].min(), data["Time (s)"].max()
-        y_min, y_max = weight_data.min(), weight_data.max()
-        ax.set_xlim([x_min, x_max])
-        ax.set_ylim([y_min, y_max])
-        chart_type.draw()
-
-    def pan_left():
-        nonlocal x_min, x_max
-        shift = (x_max - x_min) * 0.1
-        x_min, x_max = x_min - shift, x_max - shift
-        ax.set_xlim([x_min, x_max])
-        chart_type.draw()
-
-    def pan_right():
-        nonlocal x_min, x_max
-        shift = (x_max - x_min) * 0.1
-        x_min, x_max = x_min + shift, x_max + shift
-        ax.set_xlim([x_min, x_max])
-        chart_type.draw()
-
-    def pan_up():
-        nonlocal y_min, y_max
-        shift = (y_max - y_min) * 0.1
-        y_min, y_max = y_min + shift, y_max + shift
-        ax.set_ylim([y_min, y_max])
-        chart_type.draw()
-
-    def pan_down():
-        nonlocal y_min, y_max
-        shift = (y_max - y_min) * 0.1
-        y_min, y_max = y_min - shift, y_max - shift
-        ax.set_ylim([y_min, y_max])
-        chart_type.draw()
-
     def smooth_graph():
         for widget in canvas.winfo_children():
             widget.destroy()
@@ -314,64 +425,295 @@ def plot_graph(data, canvas, smooth=False):
             widget.destroy()
         plot_graph(data, canvas, smooth=False)
 
-    button_frame = ttk.Frame(canvas)
-    button_frame.pack(side="bottom", fill="x", padx=10, pady=5)
-    ttk.Button(button_frame, text="Zoom In", command=zoom_in).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="Zoom Out", command=zoom_out).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="Reset Zoom", command=reset_zoom).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="Smooth", command=smooth_graph).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="Reset Smooth", command=reset_smooth).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="←", command=pan_left).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="→", command=pan_right).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="↑", command=pan_up).pack(side="left", padx=5)
-    ttk.Button(button_frame, text="↓", command=pan_down).pack(side="left", padx=5)
+    build_chart(canvas, data["Time (s)"], weight_data, SeriesBuffer(data["Time (s)"], weight_data),
+                smooth_graph, reset_smooth)
 
 def create_gui(data):
-    root = tk.Tk()
-    root.title("Weight Analysis Report")
-    root.geometry("1000x700")
-    root.resizable(False, False)
-
-    graph_frame = ttk.LabelFrame(root, text="Graph", padding=(10, 5))
-    graph_frame.pack(side="top", fill="both", expand=True, padx=10, pady=5)
+    root, graph_frame, analysis_frame, tree = create_report_window("Weight Analysis Report")
     plot_graph(data, graph_frame)
 
     mean_weight, std_dev_weight = calculate_basic_statistics(data)
     total_impulse = calculate_total_impulse(data)
     data = analyze_weight_change(data)
 
-    analysis_frame = ttk.LabelFrame(root, text="Analysis Results", padding=(10, 5))
-    analysis_frame.pack(side="left", fill="y", expand=False, padx=10, pady=5)
-
     ttk.Label(analysis_frame, text=f"Average Weight: {mean_weight:.3f} kg").pack(anchor="w", pady=2)
     ttk.Label(analysis_frame, text=f"Standard Deviation: {std_dev_weight:.3f} kg").pack(anchor="w", pady=2)
     ttk.Label(analysis_frame, text=f"Total Impulse: {total_impulse:.3f} kg·s").pack(anchor="w", pady=2)
+    show_uncertainty(analysis_frame, data)
 
-    table_frame = ttk.LabelFrame(root, text="Weight Changes Table", padding=(10, 5))
-    table_frame.pack(side="right", fill="both", expand=True, padx=10, pady=5)
+    insert_table_rows(tree, data["Time (s)"], data["Weight (kg)"], data["Weight Change (kg)"])
 
-    cols = ("Time (s)", "Weight (kg)", "Weight Change (kg)")
-    tree = ttk.Treeview(table_frame, columns=cols, show="headings", height=15)
-    for col in cols:
-        tree.heading(col, text=col)
-        tree.column(col, anchor="center")
-
-    for _, row in data.iterrows():
-        tree.insert("", "end", values=(
-            f"{row['Time (s)']:.2f}",
-            f"{row['Weight (kg)']:.3f}",
-            f"{row['Weight Change (kg)']:.3f}" if not pd.isna(row['Weight Change (kg)']) else "N/A"
-        ))
-
-    tree.pack(side="left", fill="both", expand=True)
-    scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=tree.yview)
-    tree.configure(yscroll=scrollbar.set)
-    scrollbar.pack(side="right", fill="y")
+    root.mainloop()
 
+# Rows kept in the live table; older rows are dropped as new ones arrive
+TABLE_ROWS = 500
+
+class CaptureTail:
+    """Reads only the rows appended to a capture CSV since the previous poll."""
+
+    FINGERPRINT_BYTES = 64
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.restart()
+
+    def restart(self):
+        self.offset = 0
+        self.partial = b""
+        self.columns = None
+        self.header = b""
+        self.identity = None
+        self.fingerprint = b""
+
+    def _restarted(self, f):
+        """True if the file was replaced or rewritten since the last poll rather than appended to."""
+        stat = os.fstat(f.fileno())
+        if (stat.st_dev, stat.st_ino) != self.identity or stat.st_size < self.offset:
+            return True
+        # A capture restarted in place can already be longer than our offset, so also check that the
+        # header and the last bytes we consumed are still the same
+        f.seek(0)
+        if f.read(len(self.header)) != self.header:
+            return True
+        f.seek(self.offset - len(self.fingerprint))
+        return f.read(len(self.fingerprint)) != self.fingerprint
+
+    def poll(self):
+        """Return (times, weights, restarted) for the complete rows written since the last call.
+
+        When restarted is True the capture was started over; the rows returned are from the top of
+        the new file and anything accumulated from the old one should be discarded.
+        """
+        restarted = False
+        with open(self.file_path, "rb") as f:
+            if self.offset and self._restarted(f):
+                self.restart()
+                restarted = True
+            if self.identity is None:
+                stat = os.fstat(f.fileno())
+                self.identity = (stat.st_dev, stat.st_ino)
+            f.seek(self.offset)
+            chunk = f.read()
+        self.offset += len(chunk)
+        self.fingerprint = (self.fingerprint + chunk)[-self.FINGERPRINT_BYTES:]
+        empty = np.empty(0), np.empty(0), restarted
+
+        chunk = self.partial + chunk
+        end = chunk.rfind(b"\n") + 1
+        complete, self.partial = chunk[:end], chunk[end:]
+        if self.columns is None:
+            header_end = complete.find(b"\n") + 1
+            if not header_end:
+                self.partial = complete + self.partial
+                return empty
+            self.header = complete[:header_end]
+            self.columns = self.header.decode("utf-8").strip().split(",")
+            complete = complete[header_end:]
+        if not complete.strip():
+            return empty
+
+        rows = pd.read_csv(io.BytesIO(complete), header=None, names=self.columns)
+        return rows["Time (s)"].to_numpy(dtype=float), rows["Weight (g)"].to_numpy(dtype=float), restarted
+
+class IncrementalStats:
+    """Mean, standard deviation, impulse and weight changes updated one batch at a time."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.impulse = 0.0
+        self.last_time = None
+        self.last_weight = None
+
+    @property
+    def std(self):
+        # Sample standard deviation, same as pandas .std()
+        return np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else float("nan")
+
+    def update(self, times, weights):
+        """Fold a batch into the running statistics and return its weight changes."""
+        if not len(weights):
+            return np.empty(0)
+        # Chan et al. parallel variance: merge the batch mean/M2 into the running totals
+        batch_count = len(weights)
+        batch_mean = weights.mean()
+        batch_m2 = np.sum((weights - batch_mean) ** 2)
+        total = self.count + batch_count
+        delta = batch_mean - self.mean
+        self.mean += delta * batch_count / total
+        self.m2 += batch_m2 + delta ** 2 * self.count * batch_count / total
+        self.count = total
+
+        if self.last_time is not None:
+            times = np.concatenate(([self.last_time], times))
+            weights = np.concatenate(([self.last_weight], weights))
+            changes = np.diff(weights)
+        else:
+            changes = np.concatenate(([np.nan], np.diff(weights)))
+        self.impulse += np.sum(0.5 * (weights[1:] + weights[:-1]) * np.diff(times))
+        self.last_time, self.last_weight = times[-1], weights[-1]
+        return changes
+
+class MinMaxLOD:
+    """Min/max decimation of a growing series; only the unfinished bucket is recomputed on append."""
+
+    def __init__(self, bucket_size=32):
+        self.bucket_size = bucket_size
+        self.bucket_times = GrowableArray()
+        self.bucket_weights = GrowableArray()
+        self.pending_times = np.empty(0)
+        self.pending_weights = np.empty(0)
+
+    def extend(self, times, weights):
+        times = np.concatenate((self.pending_times, times))
+        weights = np.concatenate((self.pending_weights, weights))
+        n_full = len(weights) // self.bucket_size * self.bucket_size
+        if n_full:
+            t = times[:n_full].reshape(-1, self.bucket_size)
+            w = weights[:n_full].reshape(-1, self.bucket_size)
+            rows = np.arange(len(w))
+            lo, hi = w.argmin(axis=1), w.argmax(axis=1)
+            # Emit each bucket's min and max in time order so the envelope never doubles back
+            first = np.minimum(lo, hi)
+            second = np.maximum(lo, hi)
+            self.bucket_times.extend(np.column_stack((t[rows, first], t[rows, second])).ravel())
+            self.bucket_weights.extend(np.column_stack((w[rows, first], w[rows, second])).ravel())
+        self.pending_times = times[n_full:]
+        self.pending_weights = weights[n_full:]
+
+    def envelope(self):
+        """Views of the decimated buckets plus the raw unfinished bucket; valid until the next extend."""
+        return self.bucket_times.view(self.pending_times), self.bucket_weights.view(self.pending_weights)
+
+class MovingAverage:
+    """Trailing moving average carried across batches; the live counterpart of apply_smoothing."""
+
+    def __init__(self, window_size=5):
+        self.window_size = window_size
+        self.tail = np.empty(0)
+
+    def process(self, values):
+        values = np.concatenate((self.tail, np.asarray(values, dtype=float)))
+        sums = np.concatenate(([0.0], np.cumsum(values)))
+        end = np.arange(len(self.tail), len(values)) + 1
+        start = np.maximum(end - self.window_size, 0)
+        smoothed = (sums[end] - sums[start]) / (end - start)
+        self.tail = values[len(values) - min(len(values), self.window_size - 1):]
+        return smoothed
+
+def follow_gui(file_path, poll_ms=500, table_rows=TABLE_ROWS):
+    """Live report for a capture that is still being written; only appended rows are processed.
+
+    The table keeps only the newest table_rows rows so a long capture does not grow the Treeview
+    without bound; the statistics and the graph still cover the whole capture. The graph follows
+    the data until it is zoomed or panned, and Reset Zoom resumes following.
+    """
+    root, graph_frame, analysis_frame, tree = create_report_window(
+        f"Weight Analysis Report (following {os.path.basename(file_path)})",
+        table_title=f"Weight Changes Table (latest {table_rows} rows)")
+
+    mean_label = ttk.Label(analysis_frame, text="Average Weight: N/A kg")
+    mean_label.pack(anchor="w", pady=2)
+    std_label = ttk.Label(analysis_frame, text="Standard Deviation: N/A kg")
+    std_label.pack(anchor="w", pady=2)
+    impulse_label = ttk.Label(analysis_frame, text="Total Impulse: N/A kg·s")
+    impulse_label.pack(anchor="w", pady=2)
+    samples_label = ttk.Label(analysis_frame, text="Samples: 0")
+    samples_label.pack(anchor="w", pady=2)
+    update_uncertainty = show_uncertainty(analysis_frame)
+    # The Monte Carlo run covers the whole capture, so it is refreshed on request rather than every poll
+    ttk.Button(analysis_frame, text="Update CI",
+               command=lambda: update_uncertainty(*channels[False][0].view()[:2])).pack(anchor="w", pady=2)
+
+    tail = CaptureTail(file_path)
+    stats = smoother = channels = None
+    smooth = False
+    ax = line = chart_type = None
+
+    def reset():
+        nonlocal stats, smoother, channels
+        stats = IncrementalStats()
+        smoother = MovingAverage()
+        # Raw and smoothed series, each with its hover buffer and decimated line
+        channels = {False: (SeriesBuffer(), MinMaxLOD()), True: (SeriesBuffer(), MinMaxLOD())}
+
+    def draw_chart(smooth_on):
+        nonlocal smooth, ax, line, chart_type
+        smooth = smooth_on
+        for widget in graph_frame.winfo_children():
+            widget.destroy()
+        series, lod = channels[smooth]
+        ax, line, chart_type = build_chart(graph_frame, *lod.envelope(), series,
+                                           lambda: draw_chart(True), lambda: draw_chart(False))
+
+    def poll():
+        try:
+            times, weights, restarted = tail.poll()
+        except Exception as e:
+            messagebox.showerror("File Read Error", f"An error occurred while reading the file:\n{e}")
+            root.destroy()
+            return
+
+        if restarted:
+            reset()
+            draw_chart(smooth)
+            tree.delete(*tree.get_children())
+            mean_label.config(text="Average Weight: N/A kg")
+            std_label.config(text="Standard Deviation: N/A kg")
+            impulse_label.config(text="Total Impulse: N/A kg·s")
+            samples_label.config(text="Samples: 0")
+            update_uncertainty(np.empty(0), np.empty(0))
+
+        if len(weights):
+            changes = stats.update(times, weights)
+            for channel, values in ((False, weights), (True, smoother.process(weights))):
+                series, lod = channels[channel]
+                series.extend(times, values)
+                lod.extend(times, values)
+            line.set_data(*channels[smooth][1].envelope())
+            if not chart_type.user_view:
+                ax.relim()
+                ax.autoscale_view()
+            chart_type.draw_idle()
+
+            mean_label.config(text=f"Average Weight: {stats.mean:.3f} kg")
+            std_label.config(text=f"Standard Deviation: {stats.std:.3f} kg")
+            impulse_label.config(text=f"Total Impulse: {stats.impulse:.3f} kg·s")
+            samples_label.config(text=f"Samples: {stats.count}")
+
+            # Only the newest rows can survive the trim, so skip inserting the rest of a large batch
+            keep = slice(-table_rows, None)
+            insert_table_rows(tree, times[keep], weights[keep], changes[keep])
+            rows = tree.get_children()
+            if len(rows) > table_rows:
+                tree.delete(*rows[:len(rows) - table_rows])
+        root.after(poll_ms, poll)
+
+    reset()
+    draw_chart(False)
+    poll()
     root.mainloop()
 
 if __name__ == "__main__":
-    data = load_data()
-    create_gui(data)
+    # python analysis.py --follow [capture.csv] keeps the report updated while the capture is written
+    if len(sys.argv) > 1 and sys.argv[1] == "--follow":
+        if len(sys.argv) > 2:
+            file_path = sys.argv[2]
+        else:
+            picker = tk.Tk()
+            picker.withdraw()
+            file_path = filedialog.askopenfilename(
+                title="Select Weight Data CSV File to Follow",
+                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            )
+            picker.destroy()
+        if not file_path:
+            messagebox.showerror("File Selection Error", "No file was selected. Exiting the program.")
+            exit(1)
+        follow_gui(file_path)
+    else:
+        data = load_data()
+        create_gui(data)
 
 
@@ -0,0 +1,190 @@
+import asyncio
+import socket
+import struct
+import threading
+from collections import deque
+
+import numpy as np
+
+STREAM_PORT = 5760
+BACKLOG_SAMPLES = 8192
+STOP_TIMEOUT = 2.0
+
+# Each batch: 4-byte magic, uint32 sample count, then count × (float64 time, float32 weight)
+BATCH_MAGIC = b'WSB1'
+HEADER = struct.Struct('<4sI')
+SAMPLE_DTYPE = np.dtype([('time', '<f8'), ('weight', '<f4')])
+
+
+def encode_batch(times, weights):
+    samples = np.empty(len(times), dtype=SAMPLE_DTYPE)
+    samples['time'] = times
+    samples['weight'] = weights
+    return HEADER.pack(BATCH_MAGIC, len(samples)) + samples.tobytes()
+
+
+class SampleServer:
+    """Publishes sample batches to any number of TCP subscribers from a background asyncio loop.
+
+    publish() never blocks the caller: each client has a backlog capped at backlog_samples, and
+    when a slow client's backlog is full its oldest samples are dropped instead of stalling ingestion.
+    """
+
+    def __init__(self, host='127.0.0.1', port=STREAM_PORT, backlog_samples=BACKLOG_SAMPLES):
+        self.host = host
+        self.port = port
+        self.backlog_samples = backlog_samples
+        self.clients = set()
+        self.loop = None
+        self.server = None
+        self.thread = None
+        self.ready = threading.Event()
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        self.ready.wait()
+
+    def stop(self):
+        if self.loop and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        if self.thread:
+            self.thread.join(timeout=STOP_TIMEOUT)
+
+    def publish(self, times, weights):
+        """Queue a batch for every subscriber; safe to call from the serial thread."""
+        if not len(times) or self.loop is None or not self.clients:
+            return
+        payload = encode_batch(times, weights)
+        self.loop.call_soon_threadsafe(self._broadcast, payload)
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.server = self.loop.run_until_complete(
+                asyncio.start_server(self._handle_client, self.host, self.port))
+        except OSError as e:
+            print(f"Cannot start sample server on {self.host}:{self.port}: {e}")
+            self.loop.close()
+            self.loop = None
+            self.ready.set()
+            return
+        self.ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.server.close()
+            # Cancel the handlers rather than waiting for them; one may be stuck in drain() on a stalled client
+            tasks = [client.task for client in self.clients if client.task]
+            for task in tasks:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.run_until_complete(self.server.wait_closed())
+            self.loop.close()
+
+    def _broadcast(self, payload):
+        for client in self.clients:
+            client.put(payload)
+
+    async def _handle_client(self, reader, writer):
+        client = _ClientQueue(self.backlog_samples)
+        client.task = asyncio.current_task()
+        self.clients.add(client)
+        try:
+            while True:
+                await client.ready.wait()
+                client.ready.clear()
+                while client.batches:
+                    writer.write(client.pop())
+                await writer.drain()
+        except (ConnectionError, OSError, asyncio.CancelledError):
+            pass
+        finally:
+            self.clients.discard(client)
+            writer.transport.abort()
+
+
+class _ClientQueue:
+    """Per-subscriber backlog holding at most max_samples samples; the oldest are dropped first."""
+
+    def __init__(self, max_samples):
+        self.max_samples = max(1, max_samples)
+        self.batches = deque()
+        self.samples = 0
+        self.dropped = 0
+        self.ready = asyncio.Event()
+        self.task = None
+
+    def put(self, payload):
+        _, count = HEADER.unpack_from(payload)
+        if count > self.max_samples:
+            payload = _tail_of_batch(payload, self.max_samples)
+            self.dropped += count - self.max_samples
+            count = self.max_samples
+        while self.batches and self.samples + count > self.max_samples:
+            _, oldest = HEADER.unpack_from(self.batches.popleft())
+            self.samples -= oldest
+            self.dropped += oldest
+        self.batches.append(payload)
+        self.samples += count
+        self.ready.set()
+
+    def pop(self):
+        payload = self.batches.popleft()
+        self.samples -= HEADER.unpack_from(payload)[1]
+        return payload
+
+
+def _tail_of_batch(payload, count):
+    """Keep only the newest `count` samples of an encoded batch."""
+    return HEADER.pack(BATCH_MAGIC, count) + payload[len(payload) - count * SAMPLE_DTYPE.itemsize:]
+
+
+class SampleSubscriber(threading.Thread):
+    """Receives batches from a SampleServer and calls data_callback(time, weight) like SerialReader."""
+
+    def __init__(self, host, port, data_callback):
+        threading.Thread.__init__(self, daemon=True)
+        self.host = host
+        self.port = port
+        self.data_callback = data_callback
+        self.running = True
+        self.sock = None
+
+    def _recv_exact(self, size):
+        buf = bytearray()
+        while len(buf) < size and self.running:
+            try:
+                chunk = self.sock.recv(size - len(buf))
+            except socket.timeout:
+                continue
+            if not chunk:
+                raise ConnectionError("server closed the connection")
+            buf.extend(chunk)
+        return bytes(buf)
+
+    def run(self):
+        try:
+            self.sock = socket.create_connection((self.host, self.port), timeout=1)
+            while self.running:
+                header = self._recv_exact(HEADER.size)
+                if len(header) < HEADER.size:
+                    break
+                magic, count = HEADER.unpack(header)
+                if magic != BATCH_MAGIC:
+                    raise ConnectionError("unexpected data from server")
+                body = self._recv_exact(count * SAMPLE_DTYPE.itemsize)
+                if len(body) < count * SAMPLE_DTYPE.itemsize:
+                    break
+                for current_time, weight in np.frombuffer(body, dtype=SAMPLE_DTYPE).tolist():
+                    self.data_callback(current_time, weight)
+        except (ConnectionError, OSError) as e:
+            print(f"Stream connection error: {e}")
+        finally:
+            self.running = False
+            if self.sock:
+                self.sock.close()
+
+    def stop(self):
+        self.running = False
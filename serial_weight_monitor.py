@@ -7,17 +7,28 @@ import threading
 import time
 import matplotlib.animation as animation
 import numpy as np
+import sys
+from sample_stream import SampleServer, SampleSubscriber, STREAM_PORT
+from stream_filters import FilterChain, HampelFilter, BiquadLowPass
 
 SERIAL_PORT = 'COM5'
 BAUD_RATE = 9600
 TIME_WINDOW = 60
+PUBLISH_HOST = '127.0.0.1'  # pass --publish 0.0.0.0 to serve other PCs on the network
+SAMPLE_RATE_HZ = 10.0  # HX711 at 10 SPS (RATE pin low)
+FILTER_CUTOFF_HZ = 2.0
 
 class SerialReader(threading.Thread):
-    def __init__(self, port, baud_rate, data_callback):
+    def __init__(self, port, baud_rate, data_callback, sample_filter=None, publisher=None):
         threading.Thread.__init__(self)
         self.port = port
         self.baud_rate = baud_rate
         self.data_callback = data_callback
+        # FilterChain from stream_filters; data_callback gets (time, filtered, raw)
+        self.sample_filter = sample_filter
+        self.pending = []
+        # SampleServer that forwards every filtered batch to network subscribers
+        self.publisher = publisher
         self.running = True
         try:
             self.ser = serial.Serial(self.port, self.baud_rate, timeout=1)
@@ -28,35 +39,57 @@ class SerialReader(threading.Thread):
     def run(self):
         while self.running:
             try:
-                if self.ser.in_waiting:
+                batch = []
+                while self.ser.in_waiting:
                     line = self.ser.readline().decode('utf-8').strip()
                     if line:
                         parts = line.split(',')
                         if len(parts) == 2:
                             try:
-                                current_time = float(parts[0])
-                                weight = float(parts[1])
-                                self.data_callback(current_time, weight)
+                                batch.append((float(parts[0]), float(parts[1])))
                             except ValueError:
                                 print(f"ข้อมูลไม่ถูกต้อง: {line}")
+                if batch:
+                    self.pending.extend(batch)
+                    raw_weights = [weight for _, weight in batch]
+                    if self.sample_filter is not None:
+                        self.emit(self.sample_filter.process(raw_weights))
+                    else:
+                        self.emit(np.asarray(raw_weights))
             except serial.SerialException as e:
                 print(f"ข้อผิดพลาดในการอ่านข้อมูลจากซีเรียล: {e}")
                 self.running = False
             time.sleep(0.1)
 
+    def emit(self, filtered):
+        """Pair filter output with the oldest raw samples still waiting for it and deliver them."""
+        ready = self.pending[:len(filtered)]
+        del self.pending[:len(filtered)]
+        for (current_time, raw_weight), weight in zip(ready, filtered.tolist()):
+            self.data_callback(current_time, weight, raw_weight)
+        if ready and self.publisher is not None:
+            self.publisher.publish([current_time for current_time, _ in ready], filtered)
+
+    def flush(self):
+        """Deliver the samples the filter is still holding back; call after the thread has stopped."""
+        if self.sample_filter is not None:
+            self.emit(self.sample_filter.flush())
+
     def stop(self):
         self.running = False
         if self.ser.is_open:
             self.ser.close()
 
 class WeightApp:
-    def __init__(self, root):
+    def __init__(self, root, subscribe_host=None, publish_host=None):
         self.root = root
+        self.subscribe_host = subscribe_host
         self.root.title("Weight Monitoring")
         self.root.geometry("1000x700")
         self.root.resizable(False, False)
 
         self.fig, self.ax = plt.subplots(figsize=(8, 6))
+        self.raw_line, = self.ax.plot([], [], label="Raw (kg)", color="lightgray")
         self.line, = self.ax.plot([], [], label="Weight (kg)", color="blue")
         self.ax.set_xlabel("Time (s)")
         self.ax.set_ylabel("Weight (kg)")
@@ -87,18 +120,25 @@ class WeightApp:
 
         self.times = []
         self.weights = []
+        self.raw_weights = []
 
         self.serial_thread = None
+        self.publisher = None
+        if publish_host is not None and self.subscribe_host is None:
+            self.publisher = SampleServer(publish_host, STREAM_PORT)
+            self.publisher.start()
 
         self.ani = animation.FuncAnimation(self.fig, self.update_plot, interval=1000, blit=False)
 
-    def data_callback(self, current_time, weight):
+    def data_callback(self, current_time, weight, raw_weight=None):
         self.times.append(current_time)
         self.weights.append(weight)
+        self.raw_weights.append(weight if raw_weight is None else raw_weight)
 
         while self.times and (self.times[-1] - self.times[0]) > TIME_WINDOW:
             self.times.pop(0)
             self.weights.pop(0)
+            self.raw_weights.pop(0)
 
         self.current_weight_label.config(text=f"Current Weight: {weight:.3f} kg")
         if self.weights:
@@ -107,6 +147,7 @@ class WeightApp:
 
     def update_plot(self, frame):
         self.ax.clear()
+        self.ax.plot(self.times, self.raw_weights, label="Raw (kg)", color="lightgray")
         self.ax.plot(self.times, self.weights, label="Weight (kg)", color="blue")
         self.ax.set_xlabel("Time (s)")
         self.ax.set_ylabel("Weight (kg)")
@@ -120,7 +161,12 @@ class WeightApp:
 
     def start_reading(self):
         if not self.serial_thread or not self.serial_thread.is_alive():
-            self.serial_thread = SerialReader(SERIAL_PORT, BAUD_RATE, self.data_callback)
+            if self.subscribe_host is not None:
+                self.serial_thread = SampleSubscriber(self.subscribe_host, STREAM_PORT, self.data_callback)
+            else:
+                sample_filter = FilterChain([HampelFilter(), BiquadLowPass(FILTER_CUTOFF_HZ, SAMPLE_RATE_HZ)])
+                self.serial_thread = SerialReader(SERIAL_PORT, BAUD_RATE, self.data_callback,
+                                                  sample_filter=sample_filter, publisher=self.publisher)
             self.serial_thread.start()
             self.start_button.config(state="disabled")
             self.stop_button.config(state="normal")
@@ -129,15 +175,27 @@ class WeightApp:
         if self.serial_thread and self.serial_thread.is_alive():
             self.serial_thread.stop()
             self.serial_thread.join()
+            if isinstance(self.serial_thread, SerialReader):
+                self.serial_thread.flush()
             self.start_button.config(state="normal")
             self.stop_button.config(state="disabled")
 
     def on_close(self):
         self.stop_reading()
+        if self.publisher:
+            self.publisher.stop()
         self.root.destroy()
 
 if __name__ == "__main__":
+    # python serial_weight_monitor.py --publish [host] also serves the samples to subscribers
+    # python serial_weight_monitor.py --subscribe <host> views the stream of another acquisition PC
+    subscribe_host = None
+    publish_host = None
+    if len(sys.argv) > 2 and sys.argv[1] == "--subscribe":
+        subscribe_host = sys.argv[2]
+    elif len(sys.argv) > 1 and sys.argv[1] == "--publish":
+        publish_host = sys.argv[2] if len(sys.argv) > 2 else PUBLISH_HOST
     root = tk.Tk()
-    app = WeightApp(root)
+    app = WeightApp(root, subscribe_host, publish_host)
     root.protocol("WM_DELETE_WINDOW", app.on_close)
     root.mainloop()
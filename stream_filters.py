@@ -0,0 +1,168 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+from scipy.signal import lfilter, lfilter_zi
+
+
+class StreamFilter(ABC):
+    """Base class for online filters: process() takes a batch and keeps state for the next one.
+
+    Filters that need look-ahead may return fewer values than they were given; those values come
+    out of later process() calls or flush(), always in input order.
+    """
+
+    @abstractmethod
+    def process(self, values):
+        """Filter a batch and return the values that are ready."""
+
+    def flush(self):
+        """Return any values still held back at the end of a run and clear the filter state."""
+        self.reset()
+        return np.empty(0)
+
+    def reset(self):
+        pass
+
+
+class HampelFilter(StreamFilter):
+    """Hampel spike rejector: replaces samples far from the median of the centred window with that median.
+
+    The window is centred so a ramp such as an ignition edge is not mistaken for a spike, which
+    delays every output by window // 2 samples. Deviations below min_threshold (kgf) are never
+    spikes, otherwise a flat or quantized baseline (MAD of 0) would clamp every real change.
+    """
+
+    def __init__(self, window=7, n_sigmas=3.0, min_threshold=0.1):
+        self.window = window if window % 2 else window + 1
+        self.delay = self.window // 2
+        self.n_sigmas = n_sigmas
+        self.min_threshold = min_threshold
+        self.reset()
+
+    def reset(self):
+        # The last `delay` samples already emitted (left context) followed by the undecided ones
+        self.buffer = None
+
+    def _reject(self, padded):
+        windows = np.lib.stride_tricks.sliding_window_view(padded, self.window)
+        centre = padded[self.delay:self.delay + len(windows)]
+        median = np.median(windows, axis=1)
+        mad = 1.4826 * np.median(np.abs(windows - median[:, None]), axis=1)
+        threshold = np.maximum(self.n_sigmas * mad, self.min_threshold)
+        return np.where(np.abs(centre - median) > threshold, median, centre)
+
+    def process(self, values):
+        values = np.asarray(values, dtype=float)
+        if not len(values):
+            return values
+        if self.buffer is None:
+            # Pad the very first samples with themselves so they have a full left half-window
+            self.buffer = np.full(self.delay, values[0])
+        padded = np.concatenate((self.buffer, values))
+        if len(padded) < self.window:
+            self.buffer = padded
+            return np.empty(0)
+        self.buffer = padded[-(self.window - 1):] if self.window > 1 else np.empty(0)
+        return self._reject(padded)
+
+    def flush(self):
+        if self.buffer is None or len(self.buffer) <= self.delay:
+            self.reset()
+            return np.empty(0)
+        # Pad the last samples with the final value so they get a full right half-window
+        padded = np.concatenate((self.buffer, np.full(self.delay, self.buffer[-1])))
+        self.reset()
+        return self._reject(padded)
+
+
+def _check_cutoff(cutoff_hz, fs):
+    if not 0 < cutoff_hz < fs / 2:
+        raise ValueError(f"cutoff {cutoff_hz} Hz must be between 0 and the Nyquist frequency {fs / 2} Hz")
+
+
+class LowPassFilter(StreamFilter):
+    """First-order IIR low-pass (exponential smoothing) with the cutoff given in Hz."""
+
+    def __init__(self, cutoff_hz, fs):
+        _check_cutoff(cutoff_hz, fs)
+        alpha = 1.0 - np.exp(-2.0 * np.pi * cutoff_hz / fs)
+        self.b = np.array([alpha])
+        self.a = np.array([1.0, alpha - 1.0])
+        self.reset()
+
+    def reset(self):
+        self.zi = None
+
+    def process(self, values):
+        values = np.asarray(values, dtype=float)
+        if not len(values):
+            return values
+        if self.zi is None:
+            # Start settled on the first sample instead of ramping up from zero
+            self.zi = lfilter_zi(self.b, self.a) * values[0]
+        filtered, self.zi = lfilter(self.b, self.a, values, zi=self.zi)
+        return filtered
+
+
+class BiquadLowPass(LowPassFilter):
+    """Second-order Butterworth-style biquad low-pass (RBJ cookbook coefficients)."""
+
+    def __init__(self, cutoff_hz, fs, q=1 / np.sqrt(2)):
+        _check_cutoff(cutoff_hz, fs)
+        w0 = 2.0 * np.pi * cutoff_hz / fs
+        alpha = np.sin(w0) / (2.0 * q)
+        cos_w0 = np.cos(w0)
+        b = np.array([(1 - cos_w0) / 2, 1 - cos_w0, (1 - cos_w0) / 2])
+        a = np.array([1 + alpha, -2 * cos_w0, 1 - alpha])
+        self.b = b / a[0]
+        self.a = a / a[0]
+        self.reset()
+
+
+class KalmanFilter(StreamFilter):
+    """Scalar random-walk Kalman filter; process_var and measurement_var are in kgf²."""
+
+    def __init__(self, process_var=1e-3, measurement_var=1e-2):
+        self.process_var = process_var
+        self.measurement_var = measurement_var
+        self.reset()
+
+    def reset(self):
+        self.estimate = None
+        self.error_var = 1.0
+
+    def process(self, values):
+        values = np.asarray(values, dtype=float)
+        filtered = np.empty_like(values)
+        for i, value in enumerate(values):
+            if self.estimate is None:
+                self.estimate = value
+            self.error_var += self.process_var
+            gain = self.error_var / (self.error_var + self.measurement_var)
+            self.estimate += gain * (value - self.estimate)
+            self.error_var *= 1 - gain
+            filtered[i] = self.estimate
+        return filtered
+
+
+class FilterChain(StreamFilter):
+    """Runs a batch through several filters in order."""
+
+    def __init__(self, stages):
+        self.stages = list(stages)
+
+    def reset(self):
+        for stage in self.stages:
+            stage.reset()
+
+    def process(self, values):
+        values = np.asarray(values, dtype=float)
+        for stage in self.stages:
+            values = stage.process(values)
+        return values
+
+    def flush(self):
+        tail = np.empty(0)
+        for stage in self.stages:
+            tail = np.concatenate((stage.process(tail), stage.flush()))
+        return tail
@@ -0,0 +1,136 @@
+import sys
+
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+# 1-sigma perturbations applied to every realization
+CALIBRATION_REL_STD = 0.005   # calibration factor, fraction of reading
+ZERO_OFFSET_STD = 0.005       # tare error, kg
+ZERO_DRIFT_STD = 0.005        # zero drift accumulated over the burn, kg
+TIME_JITTER_STD = 0.001       # per-sample timestamp jitter, s
+
+N_REALIZATIONS = 5000
+CONFIDENCE = 0.95
+BURN_THRESHOLD = 0.05         # burn time is spent above this fraction of peak thrust
+MAX_CHUNK_BYTES = 64 * 1024 * 1024
+# Peak number of float64 (realizations, samples) arrays alive per chunk: the perturbed weights and
+# times, two temporaries in the impulse sum, and the boolean burn mask rounded up to one
+ARRAYS_PER_CHUNK = 5
+
+
+def _burn_window(weights, peak, burn_threshold):
+    """Indices of the first and last sample above burn_threshold × peak in every row.
+
+    Also returns a mask of the rows that burn at all; rows without positive thrust have no burn
+    window and their indices are meaningless.
+    """
+    burning = weights >= burn_threshold * peak[:, None]
+    first = burning.argmax(axis=1)
+    last = weights.shape[1] - 1 - burning[:, ::-1].argmax(axis=1)
+    return first, last, peak > 0
+
+
+def _run_metrics(times, weights, burn_threshold):
+    """Impulse, peak and burn time of every row of a (realizations, samples) batch."""
+    dt = np.diff(times, axis=1)
+    pairs = weights[:, 1:] + weights[:, :-1]
+    pairs *= dt
+    del dt
+    impulse = 0.5 * pairs.sum(axis=1)
+    del pairs
+    peak = weights.max(axis=1)
+    first, last, burned = _burn_window(weights, peak, burn_threshold)
+    rows = np.arange(len(weights))
+    burn_time = np.where(burned, times[rows, last] - times[rows, first], np.nan)
+    return impulse, peak, burn_time
+
+
+def monte_carlo_uncertainty(times, weights, n_realizations=N_REALIZATIONS,
+                            calibration_rel_std=CALIBRATION_REL_STD, zero_offset_std=ZERO_OFFSET_STD,
+                            zero_drift_std=ZERO_DRIFT_STD, time_jitter_std=TIME_JITTER_STD,
+                            confidence=CONFIDENCE, burn_threshold=BURN_THRESHOLD,
+                            max_chunk_bytes=MAX_CHUNK_BYTES, seed=None):
+    """Confidence intervals for impulse, peak thrust and burn time of one run.
+
+    Every realization rescales the run by a perturbed calibration factor, adds a zero offset and a
+    zero drift that ramps linearly across the nominal burn and then holds, and jitters the
+    timestamps. Realizations are evaluated together as a (realizations, samples) matrix, in chunks
+    sized so one chunk stays under max_chunk_bytes.
+
+    Returns {'impulse'|'peak'|'burn_time': (nominal, low, high)}. Burn time is NaN when the run
+    never produces positive thrust. Raises ValueError for fewer than 2 samples.
+    """
+    times = np.asarray(times, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    if len(times) < 2:
+        raise ValueError(f"need at least 2 samples for an uncertainty estimate, got {len(times)}")
+    order = np.argsort(times, kind="stable")
+    times, weights = times[order], weights[order]
+    rng = np.random.default_rng(seed)
+
+    nominal = _run_metrics(times[None, :], weights[None, :], burn_threshold)
+    # Drift only builds up during the burn, so a long idle tail cannot inflate it without bound;
+    # a run that never burns drifts across the whole capture instead
+    first, last, burned = _burn_window(weights[None, :], nominal[1], burn_threshold)
+    burn_start, burn_end = (times[first[0]], times[last[0]]) if burned[0] else (times[0], times[-1])
+    drift_ramp = np.clip((times - burn_start) / (burn_end - burn_start), 0.0, 1.0) \
+        if burn_end > burn_start else np.zeros_like(times)
+
+    chunk = max(1, min(n_realizations, max_chunk_bytes // (ARRAYS_PER_CHUNK * 8 * max(len(times), 1))))
+    results = []
+    for start in range(0, n_realizations, chunk):
+        size = min(chunk, n_realizations - start)
+        scale = 1.0 + rng.normal(0.0, calibration_rel_std, (size, 1))
+        offset = rng.normal(0.0, zero_offset_std, (size, 1))
+        drift = rng.normal(0.0, zero_drift_std, (size, 1))
+        sim_weights = weights * scale
+        sim_weights += offset
+        sim_weights += drift * drift_ramp
+        sim_times = rng.normal(0.0, time_jitter_std, (size, len(times)))
+        sim_times += times
+        sim_times.sort(axis=1)
+        results.append(_run_metrics(sim_times, sim_weights, burn_threshold))
+        del sim_weights, sim_times
+
+    tail = (1.0 - confidence) / 2 * 100
+    summary = {}
+    for i, name in enumerate(("impulse", "peak", "burn_time")):
+        samples = np.concatenate([r[i] for r in results])
+        # Without a nominal burn, burns found in perturbed runs are only noise crossing the threshold
+        samples = samples[~np.isnan(samples)] if not np.isnan(nominal[i][0]) else samples[:0]
+        low, high = np.percentile(samples, [tail, 100 - tail]) if len(samples) else (np.nan, np.nan)
+        summary[name] = (float(nominal[i][0]), float(low), float(high))
+    return summary
+
+
+def _analyze_file(args):
+    file_path, kwargs = args
+    data = pd.read_csv(file_path)
+    return file_path, monte_carlo_uncertainty(data["Time (s)"], data["Weight (g)"], **kwargs)
+
+
+def analyze_archive(file_paths, processes=None, **kwargs):
+    """Run monte_carlo_uncertainty over many capture CSVs, one process per file when processes > 1.
+
+    Worker processes re-import the calling script on Windows, so a script that calls this with
+    processes != 1 must do so under an `if __name__ == "__main__":` guard, as the CLI below does.
+    """
+    jobs = [(path, kwargs) for path in file_paths]
+    if processes == 1:
+        return dict(map(_analyze_file, jobs))
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return dict(pool.map(_analyze_file, jobs))
+
+
+if __name__ == "__main__":
+    # python uncertainty.py run1.csv run2.csv ... prints the confidence intervals of every capture
+    if len(sys.argv) < 2:
+        print("usage: python uncertainty.py capture.csv [capture.csv ...]")
+        sys.exit(1)
+    level = f"{CONFIDENCE * 100:.0f}%"
+    units = {"impulse": "kg·s", "peak": "kg", "burn_time": "s"}
+    for file_path, summary in analyze_archive(sys.argv[1:]).items():
+        print(file_path)
+        for name, (nominal, low, high) in summary.items():
+            print(f"  {name} {level} CI: {low:.3f} – {high:.3f} {units[name]} (nominal {nominal:.3f})")